@@ -58,7 +58,7 @@ class Account(db.Model):
     
     # Relationships
     user = db.relationship('User', back_populates='accounts')
-    cards = db.relationship('Card', back_populates='account', lazy='dynamic')
+    cards = db.relationship('Card', back_populates='account')
     
     def __repr__(self):
         return f'<Account {self.account_number}>'
@@ -106,6 +106,12 @@ class Transaction(db.Model):
     sender_account = db.relationship('Account', foreign_keys=[from_account_id], backref='sent_transactions')
     receiver_account = db.relationship('Account', foreign_keys=[to_account_id], backref='received_transactions')
     
+    # Indexes for newest-first history per account
+    __table_args__ = (
+        db.Index('ix_transactions_from_account_created', 'from_account_id', created_at.desc()),
+        db.Index('ix_transactions_to_account_created', 'to_account_id', created_at.desc()),
+    )
+    
     def __repr__(self):
         return f'<Transaction {self.transaction_id} {self.amount}>'
 
@@ -1,15 +1,24 @@
 import logging
 
-from flask import Blueprint, request, jsonify, render_template, redirect, url_for, session, flash
+import orjson
+from flask import Blueprint, request, render_template, redirect, url_for, session, flash
 from werkzeug.exceptions import NotFound, Forbidden, BadRequest
 from flask_login import login_required, current_user
 
 from app.services.account_service import AccountService
+from app.utils.orjson_response import ORJSONResponse, error_response, orjson_response
 from app.utils.validators import validate_amount, InvalidInputError
 
 accounts_bp = Blueprint('accounts', __name__)
 logger = logging.getLogger(__name__)
 
+# Pre-encoded bodies for the static server-error responses
+_ERR_GET_ACCOUNTS = orjson.dumps({'error': 'Failed to retrieve accounts', 'code': 'SERVER_ERROR'})
+_ERR_GET_ACCOUNT = orjson.dumps({'error': 'Failed to retrieve account', 'code': 'SERVER_ERROR'})
+_ERR_CREATE_ACCOUNT = orjson.dumps({'error': 'Failed to create account', 'code': 'SERVER_ERROR'})
+_ERR_GET_BALANCE = orjson.dumps({'error': 'Failed to retrieve balance', 'code': 'SERVER_ERROR'})
+_ERR_TRANSFER = orjson.dumps({'error': 'Transfer failed', 'code': 'SERVER_ERROR'})
+
 
 @accounts_bp.route('/dashboard')
 @login_required
@@ -18,8 +27,8 @@ def dashboard():
     try:
         accounts = AccountService.get_user_accounts(current_user.user_id)
         return render_template('dashboard.html', accounts=accounts)
-    except Exception as e:
-        logger.error(f"Dashboard error: {str(e)}")
+    except Exception:
+        logger.exception("Dashboard error")
         flash('Unable to load dashboard data', 'danger')
         return redirect(url_for('auth.login'))
 
@@ -31,26 +40,23 @@ def get_accounts():
     try:
         accounts = AccountService.get_user_accounts(current_user.user_id)
 
-        logger.info(f"Retrieved accounts for user {current_user.user_id}")
+        logger.info("Retrieved accounts for user %s", current_user.user_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify([{
-                'account_id': str(acc.account_id),
+            return orjson_response([{
+                'account_id': acc.account_id,
                 'account_number': acc.account_number,
-                'balance': float(acc.balance),
+                'balance': acc.balance,
                 'status': acc.status,
-                'created_at': acc.created_at.isoformat()
-            } for acc in accounts]), 200
+                'created_at': acc.created_at
+            } for acc in accounts], 200)
         else:
             return render_template('accounts.html', accounts=accounts)
 
-    except Exception as e:
-        logger.error(f"Failed to get accounts for user {current_user.user_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get accounts for user %s", current_user.user_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'error': 'Failed to retrieve accounts',
-                'code': 'SERVER_ERROR'
-            }), 500
+            return ORJSONResponse(_ERR_GET_ACCOUNTS, status=500)
         else:
             flash('Failed to retrieve accounts', 'danger')
             return redirect(url_for('accounts.dashboard'))
@@ -64,38 +70,38 @@ def get_account_details(account_id):
         account = AccountService.get_account_details(current_user.user_id, account_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'account_id': str(account.account_id),
+            return orjson_response({
+                'account_id': account.account_id,
                 'account_number': account.account_number,
-                'balance': float(account.balance),
+                'balance': account.balance,
                 'status': account.status,
-                'created_at': account.created_at.isoformat(),
+                'created_at': account.created_at,
                 'cards': [{
-                    'card_id': str(card.card_id),
+                    'card_id': card.card_id,
                     'last_four': card.card_number[-4:],
                     'is_virtual': card.is_virtual,
                     'is_active': card.is_active
                 } for card in account.cards]
-            }), 200
+            }, 200)
         else:
             return render_template('account_details.html', account=account)
 
     except NotFound as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'ACCOUNT_NOT_FOUND'}), 404
+            return error_response(str(e), 'ACCOUNT_NOT_FOUND', 404)
         else:
             flash('Account not found', 'danger')
             return redirect(url_for('accounts.get_accounts'))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this account', 'danger')
             return redirect(url_for('accounts.get_accounts'))
-    except Exception as e:
-        logger.error(f"Failed to get account {account_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get account %s", account_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to retrieve account', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_GET_ACCOUNT, status=500)
         else:
             flash('Failed to retrieve account details', 'danger')
             return redirect(url_for('accounts.get_accounts'))
@@ -108,22 +114,22 @@ def create_account():
     try:
         account = AccountService.create_account(current_user.user_id)
 
-        logger.info(f"Created new account {account.account_id} for user {current_user.user_id}")
+        logger.info("Created new account %s for user %s", account.account_id, current_user.user_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'account_id': str(account.account_id),
+            return orjson_response({
+                'account_id': account.account_id,
                 'account_number': account.account_number,
                 'message': 'Account created successfully'
-            }), 201
+            }, 201)
         else:
             flash('Account created successfully', 'success')
             return redirect(url_for('accounts.get_accounts'))
 
-    except Exception as e:
-        logger.error(f"Failed to create account for user {current_user.user_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to create account for user %s", current_user.user_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to create account', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_CREATE_ACCOUNT, status=500)
         else:
             flash('Failed to create account', 'danger')
             return redirect(url_for('accounts.dashboard'))
@@ -137,10 +143,10 @@ def get_balance(account_id):
         balance = AccountService.get_account_balance(current_user.user_id, account_id)
 
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'account_id': str(account_id),
-                'balance': float(balance)
-            }), 200
+            return orjson_response({
+                'account_id': account_id,
+                'balance': balance
+            }, 200)
         else:
             return render_template('account_balance.html', 
                                  account_id=account_id, 
@@ -148,20 +154,20 @@ def get_balance(account_id):
 
     except NotFound as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'ACCOUNT_NOT_FOUND'}), 404
+            return error_response(str(e), 'ACCOUNT_NOT_FOUND', 404)
         else:
             flash('Account not found', 'danger')
             return redirect(url_for('accounts.get_accounts'))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this account', 'danger')
             return redirect(url_for('accounts.get_accounts'))
-    except Exception as e:
-        logger.error(f"Failed to get balance for account {account_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get balance for account %s", account_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to retrieve balance', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_GET_BALANCE, status=500)
         else:
             flash('Failed to retrieve balance', 'danger')
             return redirect(url_for('accounts.get_accounts'))
@@ -178,7 +184,7 @@ def transfer_funds(account_id):
             # Check account ownership
             account = AccountService.get_account_details(current_user.user_id, account_id)
             return render_template('transfer.html', account=account)
-        except Exception as e:
+        except Exception:
             flash('Unable to access account', 'danger')
             return redirect(url_for('accounts.get_accounts'))
     
@@ -206,47 +212,47 @@ def transfer_funds(account_id):
             reference=data.get('reference', '')
         )
 
-        logger.info(f"Transfer from {account_id} to {data['to_account']} for amount {amount}")
+        logger.info("Transfer from %s to %s for amount %s", account_id, data['to_account'], amount)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'transaction_id': str(transaction.transaction_id),
-                'amount': float(transaction.amount),
+            return orjson_response({
+                'transaction_id': transaction.transaction_id,
+                'amount': transaction.amount,
                 'status': transaction.status,
                 'reference': transaction.reference
-            }), 200
+            }, 200)
         else:
             flash('Transfer completed successfully', 'success')
             return redirect(url_for('accounts.get_account_details', account_id=account_id))
 
     except BadRequest as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'VALIDATION_ERROR'}), 400
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
         else:
             flash(str(e), 'danger')
             return redirect(url_for('accounts.transfer_funds', account_id=account_id))
     except NotFound as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'ACCOUNT_NOT_FOUND'}), 404
+            return error_response(str(e), 'ACCOUNT_NOT_FOUND', 404)
         else:
             flash('Account not found', 'danger')
             return redirect(url_for('accounts.transfer_funds', account_id=account_id))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('Unauthorized access to account', 'danger')
             return redirect(url_for('accounts.dashboard'))
     except ValueError as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'INVALID_AMOUNT'}), 400
+            return error_response(str(e), 'INVALID_AMOUNT', 400)
         else:
             flash(str(e), 'danger')
             return redirect(url_for('accounts.transfer_funds', account_id=account_id))
-    except Exception as e:
-        logger.error(f"Transfer failed: {str(e)}")
+    except Exception:
+        logger.exception("Transfer failed")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Transfer failed', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_TRANSFER, status=500)
         else:
             flash('Transfer failed', 'danger')
             return redirect(url_for('accounts.transfer_funds', account_id=account_id))
@@ -4,7 +4,7 @@ from flask import Blueprint, request, jsonify, render_template, redirect, url_fo
 from flask_login import login_user, logout_user, login_required, current_user
 
 from app.services.auth_service import AuthService
-from app.utils.validators import validate_mobile_number, validate_pin, validate_request, validate_email, validate_cnic
+from app.utils.validators import validate_mobile_number, validate_pin, validate_request, validate_email, validate_cnic, normalize_mobile
 from app.utils.error_handlers import InvalidInputError
 
 auth_bp = Blueprint('auth', __name__)
@@ -101,7 +101,7 @@ def login():
         
         # Login logic
         user = AuthService.login_user(
-            mobile_number=data['mobile_number'],
+            mobile_number=normalize_mobile(data['mobile_number']),
             pin=data['pin']
         )
         
@@ -1,14 +1,22 @@
 import logging
 
-from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash
+import orjson
+from flask import Blueprint, request, render_template, redirect, url_for, flash
 from werkzeug.exceptions import BadRequest, NotFound, Forbidden
 from flask_login import login_required, current_user
 
 from app.services.card_service import CardService
+from app.utils.orjson_response import ORJSONResponse, error_response, orjson_response
 
 cards_bp = Blueprint('cards', __name__)
 logger = logging.getLogger(__name__)
 
+# Pre-encoded bodies for the static server-error responses
+_ERR_GET_CARDS = orjson.dumps({'error': 'Failed to retrieve cards', 'code': 'SERVER_ERROR'})
+_ERR_CREATE_CARD = orjson.dumps({'error': 'Card creation failed', 'code': 'SERVER_ERROR'})
+_ERR_UPDATE_STATUS = orjson.dumps({'error': 'Status update failed', 'code': 'SERVER_ERROR'})
+_ERR_REPORT_CARD = orjson.dumps({'error': 'Card report failed', 'code': 'SERVER_ERROR'})
+
 
 @cards_bp.route('/', methods=['GET'])
 @login_required
@@ -19,31 +27,34 @@ def get_cards():
 
         cards = CardService.get_user_cards(current_user.user_id, account_id)
 
-        logger.info(f"Retrieved cards for user {current_user.user_id}")
+        logger.info("Retrieved cards for user %s", current_user.user_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify([{
+            response = orjson_response([{
                 'card_id': card['card_id'],
                 'last_four': card['last_four'],
                 'expiry_date': card['expiry_date'],
                 'is_virtual': card['is_virtual'],
                 'is_active': card['is_active'],
                 'created_at': card['created_at']
-            } for card in cards]), 200
+            } for card in cards], 200)
+            # Answer If-None-Match with 304 when the card list is unchanged
+            response.add_etag()
+            return response.make_conditional(request)
         else:
             return render_template('cards.html', cards=cards, account_id=account_id)
 
     except Forbidden as e:
-        logger.warning(f"Unauthorized card access attempt by user {current_user.user_id}")
+        logger.warning("Unauthorized card access attempt by user %s", current_user.user_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this account', 'danger')
             return redirect(url_for('accounts.dashboard'))
-    except Exception as e:
-        logger.error(f"Failed to get cards: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get cards")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to retrieve cards', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_GET_CARDS, status=500)
         else:
             flash('Failed to retrieve cards', 'danger')
             return redirect(url_for('accounts.dashboard'))
@@ -96,30 +107,30 @@ def create_card():
                 address
             )
 
-        logger.info(f"Created new card {card['card_id']} for user {current_user.user_id}")
+        logger.info("Created new card %s for user %s", card['card_id'], current_user.user_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify(card), 201
+            return orjson_response(card, 201)
         else:
             flash('Card created successfully', 'success')
             return redirect(url_for('cards.get_cards', account_id=data['account_id']))
 
     except BadRequest as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'VALIDATION_ERROR'}), 400
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
         else:
             flash(str(e), 'danger')
             return redirect(url_for('accounts.dashboard'))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this account', 'danger')
             return redirect(url_for('accounts.dashboard'))
-    except Exception as e:
-        logger.error(f"Card creation failed: {str(e)}")
+    except Exception:
+        logger.exception("Card creation failed")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Card creation failed', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_CREATE_CARD, status=500)
         else:
             flash('Card creation failed', 'danger')
             return redirect(url_for('accounts.dashboard'))
@@ -149,30 +160,30 @@ def update_card_status(card_id):
             activate=activate
         )
 
-        logger.info(f"Updated status for card {card_id} to {'active' if activate else 'inactive'}")
+        logger.info("Updated status for card %s to %s", card_id, 'active' if activate else 'inactive')
         
         if request.is_json or request.method == 'PUT' or request.headers.get('Accept') == 'application/json':
-            return jsonify(card), 200
+            return orjson_response(card, 200)
         else:
             flash(f"Card {'activated' if activate else 'deactivated'} successfully", 'success')
             return redirect(url_for('cards.get_cards'))
 
     except NotFound as e:
         if request.is_json or request.method == 'PUT' or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'CARD_NOT_FOUND'}), 404
+            return error_response(str(e), 'CARD_NOT_FOUND', 404)
         else:
             flash('Card not found', 'danger')
             return redirect(url_for('cards.get_cards'))
     except Forbidden as e:
         if request.is_json or request.method == 'PUT' or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this card', 'danger')
             return redirect(url_for('cards.get_cards'))
-    except Exception as e:
-        logger.error(f"Failed to update card status: {str(e)}")
+    except Exception:
+        logger.exception("Failed to update card status")
         if request.is_json or request.method == 'PUT' or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Status update failed', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_UPDATE_STATUS, status=500)
         else:
             flash('Status update failed', 'danger')
             return redirect(url_for('cards.get_cards'))
@@ -185,30 +196,30 @@ def report_card(card_id):
     try:
         replacement = CardService.report_card_lost_or_stolen(current_user.user_id, card_id)
 
-        logger.warning(f"User {current_user.user_id} reported card {card_id} as lost/stolen")
+        logger.warning("User %s reported card %s as lost/stolen", current_user.user_id, card_id)
         
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify(replacement), 200
+            return orjson_response(replacement, 200)
         else:
             flash('Card reported as lost/stolen and replacement issued', 'success')
             return redirect(url_for('cards.get_cards'))
 
     except NotFound as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'CARD_NOT_FOUND'}), 404
+            return error_response(str(e), 'CARD_NOT_FOUND', 404)
         else:
             flash('Card not found', 'danger')
             return redirect(url_for('cards.get_cards'))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this card', 'danger')
             return redirect(url_for('cards.get_cards'))
-    except Exception as e:
-        logger.error(f"Failed to report card: {str(e)}")
+    except Exception:
+        logger.exception("Failed to report card")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Card report failed', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_REPORT_CARD, status=500)
         else:
             flash('Card report failed', 'danger')
             return redirect(url_for('cards.get_cards'))
@@ -1,15 +1,72 @@
 import logging
+import uuid
+from datetime import datetime, timezone
 
-from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash
+import orjson
+from flask import Blueprint, request, render_template, redirect, url_for, flash
 from werkzeug.exceptions import BadRequest, NotFound, Forbidden
 from flask_login import login_required, current_user
 
 from app.services.transaction_service import TransactionService
+from app.utils.orjson_response import ORJSONResponse, error_response, orjson_response
 from app.utils.validators import validate_amount, InvalidInputError
 
 transactions_bp = Blueprint('transactions', __name__)
 logger = logging.getLogger(__name__)
 
+# Pre-encoded bodies for the static server-error responses
+_ERR_GET_TRANSACTIONS = orjson.dumps({'error': 'Failed to retrieve transactions', 'code': 'SERVER_ERROR'})
+_ERR_GET_TRANSACTION = orjson.dumps({'error': 'Failed to retrieve transaction', 'code': 'SERVER_ERROR'})
+_ERR_CREATE_TRANSACTION = orjson.dumps({'error': 'Transaction failed', 'code': 'SERVER_ERROR'})
+
+
+def _encode_cursor(txn):
+    """Encode a transaction's (created_at, transaction_id) keyset position as a cursor string"""
+    return f"{txn.created_at.isoformat()}_{txn.transaction_id}"
+
+
+def _parse_cursor(cursor):
+    """
+    Parse a cursor produced by _encode_cursor
+    Returns:
+        tuple: (created_at as naive UTC datetime, transaction_id UUID)
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, sep, transaction_id = cursor.partition('_')
+    if not sep:
+        raise ValueError("Malformed cursor")
+    created_at = datetime.fromisoformat(created_at)
+    if created_at.tzinfo:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at, uuid.UUID(transaction_id)
+
+
+def _create_transfer(user_id, data, amount):
+    return TransactionService.transfer_funds(
+        user_id=user_id,
+        from_account_id=data['from_account'],
+        to_account_id=data['to_account'],
+        amount=amount,
+        reference=data.get('reference', '')
+    )
+
+
+def _create_deposit(user_id, data, amount):
+    return TransactionService.create_deposit(
+        user_id=user_id,
+        account_id=data['to_account'],
+        amount=amount,
+        reference=data.get('reference', '')
+    )
+
+
+# Transaction type -> (label, required form fields, service call)
+_TXN_HANDLERS = {
+    'transfer': ('Transfer', frozenset({'from_account', 'to_account', 'amount'}), _create_transfer),
+    'deposit': ('Deposit', frozenset({'to_account', 'amount'}), _create_deposit),
+}
+
 
 @transactions_bp.route('/', methods=['GET'])
 @login_required
@@ -17,27 +74,53 @@ def get_transactions():
     """Get transaction history for user"""
     try:
         account_id = request.args.get('account_id')
-        limit = min(int(request.args.get('limit', 50)), 100)
-        offset = int(request.args.get('offset', 0))
+        try:
+            limit = min(int(request.args.get('limit', 50)), 100)
+            offset = int(request.args.get('offset', 0))
+            if limit < 0 or offset < 0:
+                raise ValueError("Negative pagination value")
+        except ValueError:
+            if request.is_json or request.headers.get('Accept') == 'application/json':
+                return error_response('limit and offset must be non-negative integers', 'VALIDATION_ERROR', 400)
+            flash('Invalid pagination parameters', 'danger')
+            return redirect(url_for('transactions.get_transactions'))
 
+        # Keyset cursor: only return transactions after this position in the listing
+        before = request.args.get('before')
+        if before:
+            try:
+                before = _parse_cursor(before)
+            except ValueError:
+                if request.is_json or request.headers.get('Accept') == 'application/json':
+                    return error_response('Invalid pagination cursor', 'VALIDATION_ERROR', 400)
+                flash('Invalid pagination cursor', 'danger')
+                return redirect(url_for('transactions.get_transactions'))
+
+        # Fetch one extra row to tell whether another page follows
         transactions = TransactionService.get_transaction_history(
             user_id=current_user.user_id,
             account_id=account_id,
-            limit=limit,
-            offset=offset
+            limit=limit + 1,
+            offset=offset,
+            before=before
         )
+        has_more = limit > 0 and len(transactions) > limit
+        transactions = transactions[:limit]
 
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify([{
-                'transaction_id': str(txn.transaction_id),
-                'amount': float(txn.amount),
+            response = orjson_response([{
+                'transaction_id': txn.transaction_id,
+                'amount': txn.amount,
                 'type': txn.transaction_type,
                 'status': txn.status,
                 'reference': txn.reference,
-                'timestamp': txn.created_at.isoformat(),
-                'from_account': str(txn.from_account_id) if txn.from_account_id else None,
-                'to_account': str(txn.to_account_id)
-            } for txn in transactions]), 200
+                'timestamp': txn.created_at,
+                'from_account': txn.from_account_id,
+                'to_account': txn.to_account_id
+            } for txn in transactions], 200)
+            if has_more:
+                response.headers['X-Next-Cursor'] = _encode_cursor(transactions[-1])
+            return response
         else:
             return render_template('transactions.html',
                                 transactions=transactions,
@@ -45,10 +128,10 @@ def get_transactions():
                                 limit=limit,
                                 offset=offset)
 
-    except Exception as e:
-        logger.error(f"Failed to get transactions: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get transactions")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to retrieve transactions', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_GET_TRANSACTIONS, status=500)
         else:
             flash('Failed to retrieve transactions', 'danger')
             return redirect(url_for('accounts.dashboard'))
@@ -62,42 +145,44 @@ def get_transaction_details(transaction_id):
         transaction = TransactionService.get_transaction_details(current_user.user_id, transaction_id)
 
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'transaction_id': str(transaction.transaction_id),
-                'amount': float(transaction.amount),
+            from_account_id = transaction.from_account_id
+            sender = transaction.sender_account
+            return orjson_response({
+                'transaction_id': transaction.transaction_id,
+                'amount': transaction.amount,
                 'type': transaction.transaction_type,
                 'status': transaction.status,
                 'reference': transaction.reference,
-                'timestamp': transaction.created_at.isoformat(),
+                'timestamp': transaction.created_at,
                 'from_account': {
-                    'account_id': str(transaction.from_account_id),
-                    'number': transaction.sender_account.account_number if transaction.sender_account else None
-                } if transaction.from_account_id else None,
+                    'account_id': from_account_id,
+                    'number': sender.account_number if sender else None
+                } if from_account_id else None,
                 'to_account': {
-                    'account_id': str(transaction.to_account_id),
+                    'account_id': transaction.to_account_id,
                     'number': transaction.receiver_account.account_number
                 },
                 'is_fraudulent': transaction.is_fraudulent
-            }), 200
+            }, 200)
         else:
             return render_template('transaction_details.html', transaction=transaction)
 
     except NotFound as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'TRANSACTION_NOT_FOUND'}), 404
+            return error_response(str(e), 'TRANSACTION_NOT_FOUND', 404)
         else:
             flash('Transaction not found', 'danger')
             return redirect(url_for('transactions.get_transactions'))
     except Forbidden as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('You do not have access to this transaction', 'danger')
             return redirect(url_for('transactions.get_transactions'))
-    except Exception as e:
-        logger.error(f"Failed to get transaction {transaction_id}: {str(e)}")
+    except Exception:
+        logger.exception("Failed to get transaction %s", transaction_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Failed to retrieve transaction', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_GET_TRANSACTION, status=500)
         else:
             flash('Failed to retrieve transaction details', 'danger')
             return redirect(url_for('transactions.get_transactions'))
@@ -115,52 +200,31 @@ def create_transaction():
             raise BadRequest(description='Transaction type is required')
 
         # Validate based on transaction type
-        if data['type'] == 'transfer':
-            required_fields = ['from_account', 'to_account', 'amount']
-            if not all(field in data for field in required_fields):
-                raise BadRequest(description=f'Transfer requires: {required_fields}')
+        handler = _TXN_HANDLERS.get(data['type'])
+        if not handler:
+            raise BadRequest(description='Invalid transaction type')
 
-            try:
-                amount = validate_amount(data['amount'])
-            except InvalidInputError as e:
-                raise BadRequest(description=e.message)
-
-            transaction = TransactionService.transfer_funds(
-                user_id=current_user.user_id,
-                from_account_id=data['from_account'],
-                to_account_id=data['to_account'],
-                amount=amount,
-                reference=data.get('reference', '')
-            )
-        elif data['type'] == 'deposit':
-            required_fields = ['to_account', 'amount']
-            if not all(field in data for field in required_fields):
-                raise BadRequest(description=f'Deposit requires: {required_fields}')
+        label, required_fields, create = handler
+        if not required_fields.issubset(data):
+            raise BadRequest(description=f'{label} requires: {sorted(required_fields)}')
 
-            try:
-                amount = validate_amount(data['amount'])
-            except InvalidInputError as e:
-                raise BadRequest(description=e.message)
-
-            transaction = TransactionService.create_deposit(
-                user_id=current_user.user_id,
-                account_id=data['to_account'],
-                amount=amount,
-                reference=data.get('reference', '')
-            )
-        else:
-            raise BadRequest(description='Invalid transaction type')
+        try:
+            amount = validate_amount(data['amount'])
+        except InvalidInputError as e:
+            raise BadRequest(description=e.message)
+
+        transaction = create(current_user.user_id, data, amount)
 
-        logger.info(f"Transaction created: {transaction.transaction_id}")
+        logger.info("Transaction created: %s", transaction.transaction_id)
 
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({
-                'transaction_id': str(transaction.transaction_id),
+            return orjson_response({
+                'transaction_id': transaction.transaction_id,
                 'status': transaction.status,
-                'amount': float(transaction.amount),
+                'amount': transaction.amount,
                 'type': transaction.transaction_type,
-                'timestamp': transaction.created_at.isoformat()
-            }), 201
+                'timestamp': transaction.created_at
+            }, 201)
         else:
             flash('Transaction created successfully', 'success')
             if transaction.transaction_type == 'transfer':
@@ -169,29 +233,29 @@ def create_transaction():
                 return redirect(url_for('accounts.get_account_details', account_id=data['to_account']))
 
     except BadRequest as e:
-        logger.warning(f"Invalid transaction request: {str(e)}")
+        logger.warning("Invalid transaction request: %s", e)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'VALIDATION_ERROR'}), 400
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
         else:
             flash(str(e), 'danger')
             return redirect(url_for('accounts.dashboard'))
     except Forbidden as e:
-        logger.warning(f"Unauthorized transaction attempt by user {current_user.user_id}")
+        logger.warning("Unauthorized transaction attempt by user %s", current_user.user_id)
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'UNAUTHORIZED_ACCESS'}), 403
+            return error_response(str(e), 'UNAUTHORIZED_ACCESS', 403)
         else:
             flash('Unauthorized account access', 'danger')
             return redirect(url_for('accounts.dashboard'))
     except ValueError as e:
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': str(e), 'code': 'INVALID_AMOUNT'}), 400
+            return error_response(str(e), 'INVALID_AMOUNT', 400)
         else:
             flash(str(e), 'danger')
             return redirect(url_for('accounts.dashboard'))
-    except Exception as e:
-        logger.error(f"Transaction failed: {str(e)}", exc_info=True)
+    except Exception:
+        logger.exception("Transaction failed")
         if request.is_json or request.headers.get('Accept') == 'application/json':
-            return jsonify({'error': 'Transaction failed', 'code': 'SERVER_ERROR'}), 500
+            return ORJSONResponse(_ERR_CREATE_TRANSACTION, status=500)
         else:
             flash('Transaction failed', 'danger')
             return redirect(url_for('accounts.dashboard'))
\ No newline at end of file
@@ -2,7 +2,9 @@ import logging
 import uuid
 from datetime import datetime
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload, selectinload
 from werkzeug.exceptions import NotFound, Forbidden
 
 from app import db
@@ -43,7 +45,12 @@ class AccountService:
             NotFound: If account doesn't exist
             Forbidden: If user doesn't own the account 
         """
-        account = Account.query.get(account_id)
+        # Load cards up front and refuse any other lazy load from the views
+        account = db.session.execute(
+            select(Account)
+            .options(selectinload(Account.cards), raiseload('*'))
+            .where(Account.account_id == account_id)
+        ).scalar_one_or_none()
         
         if not account:
             raise NotFound(description='Account not found')
@@ -1,4 +1,5 @@
 from flask import current_app, session
+from sqlalchemy import case, or_, select, update
 from werkzeug.exceptions import Forbidden, Unauthorized
 from werkzeug.security import check_password_hash, generate_password_hash
 import uuid
@@ -29,16 +30,22 @@ class AuthService:
         Raises:
             ValueError: If mobile number, email, or CNIC already exists
         """
-        # Check if user with given mobile already exists
-        if User.query.filter_by(mobile_number=mobile_number).first():
+        # Check mobile, email and CNIC uniqueness in a single query
+        existing = db.session.execute(
+            select(User.mobile_number, User.email, User.cnic_number).where(or_(
+                User.mobile_number == mobile_number,
+                User.email == email,
+                User.cnic_number == cnic_number
+            ))
+        ).all()
+        
+        if any(row.mobile_number == mobile_number for row in existing):
             raise ValueError("A user with this mobile number already exists")
             
-        # Check if user with given email already exists
-        if User.query.filter_by(email=email).first():
+        if any(row.email == email for row in existing):
             raise ValueError("A user with this email already exists")
             
-        # Check if user with given CNIC already exists
-        if User.query.filter_by(cnic_number=cnic_number).first():
+        if existing:
             raise ValueError("A user with this CNIC number already exists")
         
         # Create new user
@@ -73,8 +80,12 @@ class AuthService:
             Unauthorized: If credentials are invalid
             Forbidden: If account is locked
         """
-        # Find user by mobile number
-        user = User.query.filter_by(mobile_number=mobile_number).first()
+        # Find user by mobile number, locking the row so concurrent failed
+        # attempts cannot overwrite each other's counter
+        user = db.session.execute(
+            select(User).where(User.mobile_number == mobile_number).with_for_update()
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
         
         # Check if user exists
         if not user:
@@ -86,16 +97,23 @@ class AuthService:
         
         # Verify PIN
         if not user.check_pin(pin):
-            # Increment failed attempts
-            user.failed_login_attempts += 1
+            # Increment failed attempts and lock at the threshold in one atomic UPDATE
+            attempts = User.failed_login_attempts + 1
+            account_locked = db.session.execute(
+                update(User)
+                .where(User.user_id == user.user_id)
+                .values(
+                    failed_login_attempts=attempts,
+                    account_locked=case((attempts >= 5, True), else_=User.account_locked)
+                )
+                .returning(User.account_locked)
+                .execution_options(synchronize_session=False)
+            ).scalar_one()
+            db.session.commit()
             
-            # Lock account if too many failed attempts
-            if user.failed_login_attempts >= 5:
-                user.account_locked = True
-                db.session.commit()
+            if account_locked:
                 raise Forbidden("Account has been locked due to too many failed attempts")
                 
-            db.session.commit()
             raise Unauthorized("Invalid mobile number or PIN")
         
         # Reset failed attempts on successful login
@@ -136,7 +154,9 @@ class AuthService:
             Unauthorized: If old PIN is incorrect
             ValueError: If new PIN does not meet requirements
         """
-        user = User.query.get(user_id)
+        # Lock the row so concurrent resets are serialized; populate_existing
+        # refreshes the copy the user loader already put in the identity map
+        user = db.session.get(User, user_id, with_for_update=True, populate_existing=True)
         
         if not user:
             raise ValueError("User not found")
@@ -2,6 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+from sqlalchemy import and_, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from werkzeug.exceptions import NotFound, Forbidden
 
@@ -81,15 +82,13 @@ class TransactionService:
             TransactionService._check_for_fraud(transaction)
 
             logger.info(
-                f"Transfer of {amount} from {from_account_id} to {to_account_id} by user {user_id}"
+                "Transfer of %s from %s to %s by user %s", amount, from_account_id, to_account_id, user_id
             )
             return transaction
 
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             db.session.rollback()
-            logger.error(
-                f"Transfer failed between {from_account_id} and {to_account_id}: {str(e)}"
-            )
+            logger.exception("Transfer failed between %s and %s", from_account_id, to_account_id)
             raise ValueError("Transaction processing failed")
 
     @staticmethod
@@ -132,16 +131,16 @@ class TransactionService:
             db.session.add(transaction)
             db.session.commit()
 
-            logger.info(f"Deposit of {amount} to account {account_id}")
+            logger.info("Deposit of %s to account %s", amount, account_id)
             return transaction
 
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             db.session.rollback()
-            logger.error(f"Deposit failed to account {account_id}: {str(e)}")
+            logger.exception("Deposit failed to account %s", account_id)
             raise ValueError("Deposit processing failed")
 
     @staticmethod
-    def get_transaction_history(user_id, account_id=None, limit=50, offset=0):
+    def get_transaction_history(user_id, account_id=None, limit=50, offset=0, before=None):
         """
         Get transaction history for user with pagination
         Args:
@@ -149,15 +148,19 @@ class TransactionService:
             account_id: Optional specific account UUID
             limit: Max results to return
             offset: Pagination offset
+            before: Optional keyset cursor; a (created_at, transaction_id) tuple of the
+                last transaction on the previous page
         Returns:
             List[Transaction]: List of transaction records
         """
         try:
-            base_query = Transaction.query.join(
-                Account,
-                (Transaction.from_account_id == Account.account_id) |
-                (Transaction.to_account_id == Account.account_id)
-            ).filter(Account.user_id == user_id)
+            # Filter on a subquery rather than joining, so a transfer between two of
+            # the user's own accounts is one row and LIMIT counts it once
+            user_accounts = select(Account.account_id).where(Account.user_id == user_id)
+            base_query = Transaction.query.filter(
+                Transaction.from_account_id.in_(user_accounts) |
+                Transaction.to_account_id.in_(user_accounts)
+            )
 
             if account_id:
                 # Verify account belongs to user
@@ -172,12 +175,21 @@ class TransactionService:
                     (Transaction.to_account_id == account_id)
                 )
 
+            if before:
+                # Tie-break on transaction_id so rows sharing a timestamp are not skipped
+                created_at, transaction_id = before
+                base_query = base_query.filter(or_(
+                    Transaction.created_at < created_at,
+                    and_(Transaction.created_at == created_at, Transaction.transaction_id < transaction_id)
+                ))
+
             return base_query.order_by(
-                Transaction.created_at.desc()
+                Transaction.created_at.desc(),
+                Transaction.transaction_id.desc()
             ).limit(limit).offset(offset).all()
 
-        except SQLAlchemyError as e:
-            logger.error(f"Failed to get transactions for user {user_id}: {str(e)}")
+        except SQLAlchemyError:
+            logger.exception("Failed to get transactions for user %s", user_id)
             raise ValueError("Failed to retrieve transaction history")
 
     @staticmethod
@@ -208,8 +220,8 @@ class TransactionService:
 
             return transaction
 
-        except SQLAlchemyError as e:
-            logger.error(f"Failed to get transaction {transaction_id}: {str(e)}")
+        except SQLAlchemyError:
+            logger.exception("Failed to get transaction %s", transaction_id)
             raise ValueError("Failed to retrieve transaction details")
 
     @staticmethod
@@ -243,6 +255,6 @@ class TransactionService:
 
             db.session.commit()
 
-        except Exception as e:
-            logger.warning(f"Fraud detection failed for transaction {transaction.transaction_id}: {str(e)}")
+        except Exception:
+            logger.warning("Fraud detection failed for transaction %s", transaction.transaction_id, exc_info=True)
             db.session.rollback()
@@ -1,18 +1,23 @@
 import logging
-from flask import jsonify, request
+from flask import request
 from werkzeug.exceptions import HTTPException
 
+from app.utils.orjson_response import orjson_response
+
 logger = logging.getLogger(__name__)
 
 
 class InvalidInputError(Exception):
     """Custom exception for invalid user input"""
 
+    # Raised on every rejected input, so skip the per-instance attribute dict
+    __slots__ = ('message', 'field', 'code')
+
     def __init__(self, message, field=None, code=400):
+        super().__init__(message)
         self.message = message
         self.field = field
         self.code = code
-        super().__init__(message)
 
 
 class BusinessRuleError(Exception):
@@ -39,49 +44,49 @@ def register_error_handlers(app):
             response['field'] = error.field
 
         logger.warning(f"Validation error: {error.message} - Path: {request.path}")
-        return jsonify(response), error.code
+        return orjson_response(response, error.code)
 
     @app.errorhandler(BusinessRuleError)
     def handle_business_error(error):
         """Handle business logic errors"""
         logger.warning(f"Business rule violation: {error.message}")
-        return jsonify({
+        return orjson_response({
             'error': error.message,
             'code': 'BUSINESS_RULE_ERROR',
             'status': error.code
-        }), error.code
+        }, error.code)
 
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 Not Found errors"""
         logger.info(f"404 Not Found: {request.path}")
-        return jsonify({
+        return orjson_response({
             'error': 'Resource not found',
             'code': 'NOT_FOUND',
             'status': 404,
             'path': request.path
-        }), 404
+        }, 404)
 
     @app.errorhandler(500)
     def handle_server_error(error):
         """Handle 500 Internal Server errors"""
         logger.error(f"500 Error: {str(error)}", exc_info=True)
-        return jsonify({
+        return orjson_response({
             'error': 'Internal server error',
             'code': 'INTERNAL_ERROR',
             'status': 500,
             'request_id': request.environ.get('REQUEST_ID', '')
-        }), 500
+        }, 500)
 
     @app.errorhandler(Exception)
     def handle_unexpected_error(error):
         """Catch-all for unhandled exceptions"""
         logger.critical(f"Unhandled exception: {str(error)}", exc_info=True)
-        return jsonify({
+        return orjson_response({
             'error': 'An unexpected error occurred',
             'code': 'UNKNOWN_ERROR',
             'status': 500
-        }), 500
+        }, 500)
 
     @app.errorhandler(HTTPException)
     def handle_http_exception(error):
@@ -92,4 +97,4 @@ def register_error_handlers(app):
             'status': error.code
         }
         logger.warning(f"HTTP {error.code}: {error.description}")
-        return jsonify(response), error.code
+        return orjson_response(response, error.code)
@@ -0,0 +1,78 @@
+from decimal import Decimal
+
+import orjson
+from flask import Request, Response
+
+
+class ORJSONResponse(Response):
+    """Response class for JSON bodies encoded with orjson"""
+
+    default_mimetype = 'application/json'
+
+
+class ORJSONRequest(Request):
+    """Request class that parses JSON bodies with orjson"""
+
+    def get_json(self, force=False, silent=False, cache=True):
+        """Parse the request body as JSON, mirroring Werkzeug's caching and error handling"""
+        if cache and self._cached_json[silent] is not Ellipsis:
+            return self._cached_json[silent]
+
+        if not (force or self.is_json):
+            return None if silent else self.on_json_loading_failed(None)
+
+        try:
+            rv = orjson.loads(self.get_data(cache=cache))
+        except orjson.JSONDecodeError as e:
+            if not silent:
+                return self.on_json_loading_failed(e)
+            if cache:
+                self._cached_json = (self._cached_json[0], None)
+            return None
+
+        if cache:
+            self._cached_json = (rv, rv)
+        return rv
+
+
+def _default(obj):
+    """Encode types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        # Keep monetary values exact instead of going through float
+        return str(obj)
+    raise TypeError
+
+
+def orjson_response(obj, status=200):
+    """
+    Serialize an object with orjson and wrap it in a JSON response
+    Args:
+        obj: JSON-serializable payload (UUID, datetime and Decimal values are encoded directly)
+        status: HTTP status code
+    Returns:
+        ORJSONResponse: The encoded response
+    """
+    return ORJSONResponse(
+        orjson.dumps(obj, default=_default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_UUID),
+        status=status
+    )
+
+
+# Pre-encoded error bodies keyed by error code, with a %s slot for the message
+_ERROR_TEMPLATES = {}
+
+
+def error_response(message, code, status):
+    """
+    Build a JSON error response from a pre-encoded per-code template
+    Args:
+        message: Error message
+        code: Machine-readable error code
+        status: HTTP status code
+    Returns:
+        ORJSONResponse: The error response
+    """
+    template = _ERROR_TEMPLATES.get(code)
+    if template is None:
+        template = _ERROR_TEMPLATES[code] = b'{"error":%s,"code":' + orjson.dumps(code) + b'}'
+    return ORJSONResponse(template % orjson.dumps(message), status=status)
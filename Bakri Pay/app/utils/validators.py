@@ -1,11 +1,83 @@
 import re
-from datetime import datetime
-from functools import wraps
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache, wraps
 
+import orjson
 import phonenumbers
-from flask import jsonify, request
+from flask import request
 
 from app.utils.error_handlers import InvalidInputError
+from app.utils.orjson_response import ORJSONResponse
+
+_EMAIL_LOCAL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789.-')
+_EMAIL_TLD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz')
+_EXPIRY_RE = re.compile(r'^(0[1-9]|1[0-2])/?([0-9]{2})$')
+# ASCII digits only, at most 10 before the point to fit the Numeric(12, 2) columns
+_AMOUNT_RE = re.compile(r'^\s*([0-9]{1,10})(?:\.([0-9]{1,2}))?\s*$')
+_MAX_CENTS = 10 ** 12
+
+# Characters allowed in a mobile number written in international format
+_MOBILE_ALLOWED_CHARS = frozenset('+0123456789 -()')
+
+# Parse results (valid and invalid) keyed by raw mobile number input, least recently used first
+_MOBILE_CACHE = OrderedDict()
+_MOBILE_MAX = 8192
+
+# Marks a field absent from the request body, as opposed to one sent as null
+_MISSING = object()
+
+
+def _parse_e164(number):
+    """
+    Parse and normalize a mobile number
+    Returns:
+        tuple: (True, E.164 number) if valid, otherwise (False, error message)
+    """
+    try:
+        parsed = phonenumbers.parse(number)
+    except phonenumbers.NumberParseException:
+        return False, "Invalid phone number format"
+
+    if not phonenumbers.is_valid_number(parsed):
+        return False, "Invalid phone number"
+
+    return True, phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+
+
+def _lookup_mobile(number):
+    """Return the (ok, value) parse result for a raw number, shared across endpoints via an LRU cache"""
+    result = _MOBILE_CACHE.get(number)
+    if result is not None:
+        try:
+            _MOBILE_CACHE.move_to_end(number)
+        except KeyError:
+            # Evicted by another thread between the lookup and the move
+            pass
+        return result
+
+    result = _MOBILE_CACHE[number] = _parse_e164(number)
+    if len(_MOBILE_CACHE) > _MOBILE_MAX:
+        _MOBILE_CACHE.popitem(last=False)
+    return result
+
+
+def normalize_mobile(number):
+    """
+    Normalize a mobile number to E.164 without raising
+    Returns:
+        str: E.164 number if valid, otherwise the input unchanged
+    """
+    if (
+        isinstance(number, str) and number.startswith('+')
+        and 8 <= len(number) <= 20 and _MOBILE_ALLOWED_CHARS.issuperset(number)
+    ):
+        ok, value = _lookup_mobile(number)
+        if ok:
+            return value
+    return number
 
 
 def validate_mobile_number(number):
@@ -16,27 +88,25 @@ def validate_mobile_number(number):
     Raises:
         InvalidInputError: If invalid
     """
-    try:
-        if not number.startswith('+'):
-            raise InvalidInputError("Number must start with country code (e.g. +92...)", field="mobile_number")
-
-        parsed = phonenumbers.parse(number)
-        if not phonenumbers.is_valid_number(parsed):
-            raise InvalidInputError("Invalid phone number", field="mobile_number")
-
-        return phonenumbers.format_number(
-            parsed,
-            phonenumbers.PhoneNumberFormat.E164
-        )
-    except Exception as e:
-        if isinstance(e, InvalidInputError):
-            raise e
+    if not isinstance(number, str):
+        raise InvalidInputError("Invalid phone number format", field="mobile_number")
+    if not number.startswith('+'):
+        raise InvalidInputError("Number must start with country code (e.g. +92...)", field="mobile_number")
+    # Cheap shape check so junk never reaches phonenumbers or the parse cache
+    if not (8 <= len(number) <= 20 and _MOBILE_ALLOWED_CHARS.issuperset(number)):
         raise InvalidInputError("Invalid phone number format", field="mobile_number")
 
+    ok, value = _lookup_mobile(number)
+    if not ok:
+        raise InvalidInputError(value, field="mobile_number")
+    return value
+
 
 def validate_pin(pin):
     """Validate 4-6 digit PIN"""
-    if not (pin.isdigit() and 4 <= len(pin) <= 6):
+    # Length first so oversized input is rejected without scanning it; isascii()
+    # keeps out non-ASCII digits that isdigit() would otherwise accept
+    if not (isinstance(pin, str) and 4 <= len(pin) <= 6 and pin.isascii() and pin.isdigit()):
         raise InvalidInputError("PIN must be 4-6 digits", field="pin")
     
     # Check for simple sequences or repeated digits
@@ -47,86 +117,144 @@ def validate_pin(pin):
 
 
 def validate_email(email):
-    """Validate email format"""
-    pattern = r'^[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}$'
-    if not re.match(pattern, email.lower()):
+    """Validate email format with a single linear scan (no regex backtracking)"""
+    email = email.strip().lower()
+    local, at, domain = email.rpartition('@')
+    host, dot, tld = domain.rpartition('.')
+    if not (
+        at and dot and local and host and len(tld) >= 2
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _EMAIL_TLD_CHARS.issuperset(tld)
+    ):
         raise InvalidInputError("Invalid email address", field="email")
-    return email.lower().strip()
+    return email
 
 
 def validate_cnic(cnic):
     """Validate Pakistani CNIC format (XXXXX-XXXXXXX-X)"""
-    if not re.match(r'^\d{5}-\d{7}-\d$', cnic):
+    if not (
+        isinstance(cnic, str) and len(cnic) == 15 and cnic.isascii()
+        and cnic[5] == '-' and cnic[13] == '-'
+        and cnic[:5].isdigit() and cnic[6:13].isdigit() and cnic[14].isdigit()
+    ):
         raise InvalidInputError("CNIC must be in XXXXX-XXXXXXX-X format", field="cnic")
     return cnic
 
 
 def validate_amount(amount):
-    """Validate positive amount with 2 decimal places"""
-    try:
-        amount = float(amount)
-        if amount <= 0:
-            raise InvalidInputError("Amount must be positive", field="amount")
-        return round(amount, 2)
-    except ValueError:
+    """
+    Validate positive amount with at most 2 decimal places
+    Returns:
+        Decimal: Amount with exactly 2 decimal places
+    Raises:
+        InvalidInputError: If invalid
+    """
+    if isinstance(amount, str):
+        match = _AMOUNT_RE.match(amount)
+        if not match:
+            raise InvalidInputError("Invalid amount", field="amount")
+        cents = int(match.group(1)) * 100 + int((match.group(2) or '0').ljust(2, '0'))
+    elif isinstance(amount, (int, float, Decimal)) and not isinstance(amount, bool):
+        try:
+            # str() keeps floats like 0.1 at their shortest repr rather than binary expansion
+            scaled = Decimal(str(amount)).scaleb(2)
+        except (ArithmeticError, ValueError):
+            raise InvalidInputError("Invalid amount", field="amount")
+        # Same rules as the string path: finite, whole cents, within Numeric(12, 2)
+        if not scaled.is_finite() or scaled != scaled.to_integral_value() or scaled >= _MAX_CENTS:
+            raise InvalidInputError("Invalid amount", field="amount")
+        cents = int(scaled)
+    else:
         raise InvalidInputError("Invalid amount", field="amount")
 
+    if cents <= 0:
+        raise InvalidInputError("Amount must be positive", field="amount")
+    return Decimal(cents).scaleb(-2)
+
 
 def validate_date(date_str, fmt='%Y-%m-%d'):
     """Validate date format"""
     try:
+        # Fast path for zero-padded ISO dates, skipping strptime's locked format cache
+        if (
+            fmt == '%Y-%m-%d' and len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str.isascii() and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+        ):
+            return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
         return datetime.strptime(date_str, fmt).date()
-    except ValueError:
+    except (TypeError, ValueError):
         raise InvalidInputError(f"Date must be in {fmt} format", field="date")
 
 
 def validate_card_expiry(expiry):
     """Validate MM/YY format and future date"""
     try:
-        if not re.match(r'^(0[1-9]|1[0-2])\/?([0-9]{2})$', expiry):
+        match = _EXPIRY_RE.match(expiry)
+        if not match:
             raise ValueError
-        
-        # Normalize format by ensuring there's a '/'
-        if '/' not in expiry:
-            expiry = f"{expiry[:2]}/{expiry[2:]}"
-
-        month, year = map(int, expiry.split('/'))
-        current_year = datetime.now().year % 100
-        current_month = datetime.now().month
-
-        if year < current_year or (year == current_year and month < current_month):
-            raise InvalidInputError("Card has expired", field="expiry")
-
-        return expiry
-    except InvalidInputError:
-        raise
-    except:
+        month, year = int(match.group(1)), int(match.group(2))
+    except (TypeError, ValueError):
         raise InvalidInputError("Expiry must be in MM/YY format", field="expiry")
 
+    now = datetime.now()
+    current_year = now.year % 100
+    if year < current_year or (year == current_year and month < now.month):
+        raise InvalidInputError("Card has expired", field="expiry")
+
+    # Normalize format by ensuring there's a '/'
+    return f"{match.group(1)}/{match.group(2)}"
+
+
+@lru_cache(maxsize=256)
+def _validation_error_body(message, field):
+    """Encode a validation error body, memoized since validators raise a small fixed set of messages"""
+    return orjson.dumps({"error": message, "field": field, "code": "VALIDATION_ERROR"})
+
 
 def validate_request(schema):
     """Decorator to validate request data against schema"""
 
     def decorator(f):
+        # Resolve everything that depends only on the schema once, including the
+        # missing-field messages, so a request just walks a flat tuple
+        items = tuple(
+            (field, validator, f"Missing required field: {field}")
+            for field, validator in schema.items()
+        )
+
         @wraps(f)
         def wrapper(*args, **kwargs):
             try:
-                data = request.get_json()
-                if not data:
+                data = request.get_json(silent=True)
+                if not data or not isinstance(data, dict):
                     raise InvalidInputError("Missing request body")
-                    
+
+                get = data.get
                 validated_data = {}
-                for field, validator in schema.items():
-                    if field not in data:
-                        raise InvalidInputError(f"Missing required field: {field}", field=field)
-                    validated_data[field] = validator(data[field])
-                
+                for field, validator, missing_message in items:
+                    value = get(field, _MISSING)
+                    if value is _MISSING:
+                        raise InvalidInputError(missing_message, field=field)
+                    validated_data[field] = validator(value)
+
                 # Add validated data to request for the route handler
                 request.validated_data = validated_data
                 return f(*args, **kwargs)
             except InvalidInputError as e:
-                return jsonify({"error": e.message, "field": e.field, "code": "VALIDATION_ERROR"}), e.code
+                return ORJSONResponse(_validation_error_body(e.message, e.field), status=e.code)
 
         return wrapper
 
     return decorator
+
+
+def _warm():
+    """Load phonenumbers metadata and compile its patterns for the regions we serve (+92, +1, +44)"""
+    for region in ('PK', 'US', 'GB'):
+        example = phonenumbers.example_number_for_type(region, phonenumbers.PhoneNumberType.MOBILE)
+        _parse_e164(phonenumbers.format_number(example, phonenumbers.PhoneNumberFormat.E164))
+
+
+# Pay the lazy-loading cost at import rather than on each worker's first request
+_warm()
@@ -7,6 +7,15 @@ env_path = Path('.') / '.env'
 if env_path.exists():
     load_dotenv(dotenv_path=env_path)
 
+def _database_uri():
+    """Resolve the database URL, using the psycopg 3 driver for PostgreSQL"""
+    uri = os.getenv('DATABASE_URL', 'sqlite:///banking.db')
+    for prefix in ('postgres://', 'postgresql://'):
+        if uri.startswith(prefix):
+            return 'postgresql+psycopg://' + uri[len(prefix):]
+    return uri
+
+
 class Config:
     """Base configuration with shared settings."""
     SECRET_KEY = os.getenv('SESSION_SECRET', os.urandom(24).hex())
@@ -14,14 +23,18 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
 
     # Database configuration
-    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///banking.db')
+    SQLALCHEMY_DATABASE_URI = _database_uri()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
         'pool_recycle': 300,
         'pool_size': 20,
         'max_overflow': 30,
+        'pool_use_lifo': True,  # Reuse the most recently returned (warm) connection
     }
+    if SQLALCHEMY_DATABASE_URI.startswith('postgresql+psycopg://'):
+        # Prepare repeated queries server-side after 5 executions on a connection
+        SQLALCHEMY_ENGINE_OPTIONS['connect_args'] = {'prepare_threshold': 5}
 
     # Session settings
     PERMANENT_SESSION_LIFETIME = 3600
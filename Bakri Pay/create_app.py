@@ -27,6 +27,10 @@ def create_app(config_class='config.DevelopmentConfig'):
     # Load configuration
     app.config.from_object(config_class)
     
+    # Parse JSON request bodies with orjson
+    from app.utils.orjson_response import ORJSONRequest
+    app.request_class = ORJSONRequest
+    
     # Configure for proxy use if behind one
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
     
@@ -1,6 +1,8 @@
 import os
 import sys
 
+from asgiref.wsgi import WsgiToAsgi
+
 # Add the parent directory to sys.path
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 
@@ -10,6 +12,9 @@ from create_app import create_app
 config_class = os.getenv('FLASK_CONFIG', 'config.DevelopmentConfig')
 app = create_app(config_class=config_class)
 
+# ASGI entry point, e.g. `uvicorn main:asgi_app --workers 4`
+asgi_app = WsgiToAsgi(app)
+
 if __name__ == '__main__':
     # App server settings
     host = os.getenv('FLASK_HOST', '0.0.0.0')